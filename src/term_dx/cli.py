@@ -7,6 +7,7 @@ run_diagnosis(). Run after setting cluster context (e.g. set-clus staging).
 
 from __future__ import annotations
 
+import contextlib
 import sys
 from typing import Optional
 
@@ -14,6 +15,7 @@ import click
 
 from .config import ALL_TYPES, RESOURCE_ALIASES
 from .diagnose import list_terminating, run_diagnosis
+from .kubectl import clear_cache, kubectl_proxy
 
 # Shown at the bottom of term-dx --help / term-dx -h
 EPILOG = """
@@ -29,6 +31,7 @@ Examples:
   term-dx pod my-pod -n app      # Diagnose why pod my-pod in app is stuck
   term-dx -l                     # List only (no diagnosis)
   term-dx --long                 # Include all info (e.g. unavailable API services)
+  term-dx --proxy                # Reuse one kubectl proxy for per-resource lookups
 
 Run after setting cluster context (e.g. set-clus staging).
 """
@@ -64,6 +67,13 @@ Run after setting cluster context (e.g. set-clus staging).
     is_flag=True,
     help="Include all diagnostic info (e.g. unavailable API services for namespaces)",
 )
+@click.option(
+    "--proxy",
+    "use_proxy",
+    is_flag=True,
+    help="Serve per-resource lookups through one 'kubectl proxy' for the run "
+    "(faster with many terminating resources; opens a local 127.0.0.1 port while running)",
+)
 @click.argument(
     "resource_type",
     type=click.Choice(list(RESOURCE_ALIASES), case_sensitive=False),
@@ -75,6 +85,7 @@ def main(
     list_only: bool,
     verbose: bool,
     long_output: bool,
+    use_proxy: bool,
     resource_type: Optional[str],
     name: Optional[str],
 ) -> int:
@@ -85,18 +96,31 @@ def main(
     run_diagnosis(). Resource type and name are optional; when omitted,
     all supported kinds are scanned.
     """
+    clear_cache()
     if resource_type:
         types_to_scan = [RESOURCE_ALIASES[resource_type]]
     else:
         types_to_scan = ALL_TYPES
 
+    # Explicit kinds are always scanned, even cluster-scoped ones under -n
+    user_specified_kind = resource_type is not None
     ns: Optional[str] = namespace or None
     resource_name: Optional[str] = name or None
 
-    if list_only:
-        list_terminating(types_to_scan, ns, resource_name)
+    # With --proxy, one long-lived kubectl proxy serves per-resource lookups for the
+    # run. Listing makes no such lookups and a single named resource is one GET,
+    # so neither is worth starting it for.
+    if use_proxy and not list_only and resource_name is None:
+        proxy = kubectl_proxy()
     else:
-        run_diagnosis(types_to_scan, ns, resource_name, verbose, long_output)
+        proxy = contextlib.nullcontext()
+    with proxy:
+        if list_only:
+            list_terminating(types_to_scan, ns, resource_name, user_specified_kind)
+        else:
+            run_diagnosis(
+                types_to_scan, ns, resource_name, verbose, long_output, user_specified_kind
+            )
 
     return 0
 
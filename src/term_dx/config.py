@@ -9,6 +9,9 @@ resource kinds (and CLI aliases) that term-dx can scan for terminating state.
 BOLD = "\033[1m"   # Start bold
 SGR0 = "\033[0m"   # Reset (end bold)
 
+# kubectl patch arguments that clear all finalizers (shared by every remediation command).
+PATCH_NULL_FINALIZERS = '-p \'{"metadata":{"finalizers":null}}\' --type=merge'
+
 # Kubectl plural resource types we scan for terminating state (must match `kubectl get <kind>`).
 ALL_TYPES = [
     "namespaces",
@@ -42,3 +45,6 @@ RESOURCE_ALIASES = {
     "secret": "secrets",
     "secrets": "secrets",
 }
+
+# Seconds a cached "kubectl api-resources" listing stays fresh (under ~/.cache/term-dx).
+API_RESOURCES_CACHE_TTL = 600
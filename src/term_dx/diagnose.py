@@ -8,62 +8,163 @@ remediation command).
 
 from __future__ import annotations
 
-from typing import Optional
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, TextIO, TypeVar
 
-from .config import BOLD, CLUSTER_SCOPED_KINDS, SGR0
+from .config import BOLD, CLUSTER_SCOPED_KINDS, PATCH_NULL_FINALIZERS, SGR0
 from .kubectl import (
-    items_with_deletion,
+    cached_api_resources,
+    kubectl_get_finalizers,
     kubectl_get_json,
+    kubectl_get_many_finalizers,
     kubectl_get_resource_json,
+    kubectl_get_terminating_names,
+    kubectl_stream_terminating,
     run_kubectl,
 )
 
+# Upper bound on concurrent kubectl processes when scanning kinds.
+MAX_SCAN_WORKERS = 8
+# Upper bound on concurrent kubectl processes when probing namespace contents.
+MAX_RESOURCE_WORKERS = 16
+
+_T = TypeVar("_T")
+
+
+def _terminating_items(kind: str, namespace: Optional[str], name: Optional[str]) -> list[dict]:
+    """Return the terminating resources of one kind (runs on a worker thread)."""
+    return list(kubectl_stream_terminating(kind, name=name, namespace=namespace))
+
+
+def _terminating_names(
+    kind: str, namespace: Optional[str], name: Optional[str]
+) -> list[tuple[str, str, str]]:
+    """Return (namespace, name, deletionTimestamp) for terminating resources of one kind."""
+    return kubectl_get_terminating_names(kind, name=name, namespace=namespace)
+
+
+def _fetch_all(
+    types: list[str],
+    namespace: Optional[str],
+    name: Optional[str],
+    fetch: Callable[[str, Optional[str], Optional[str]], _T] = _terminating_items,
+) -> Iterator[tuple[str, _T]]:
+    """
+    Run fetch(kind, namespace, name) for every kind concurrently, yielding
+    (kind, result) in input order.
+
+    Each kubectl call is I/O-bound on cluster round-trip time, so the calls run
+    on a small thread pool; results are yielded in the order of types so output
+    stays deterministic. A single kind (e.g. one named resource) runs inline,
+    since a pool buys nothing for one call. By default fetch returns the
+    terminating items of a kind.
+    """
+    if not types:
+        return
+    if len(types) == 1:
+        yield types[0], fetch(types[0], namespace, name)
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(types))) as executor:
+        futures = [(kind, executor.submit(fetch, kind, namespace, name)) for kind in types]
+        for kind, future in futures:
+            yield kind, future.result()
+
+
+def _scoped_kinds(
+    types_to_scan: list[str], namespace: Optional[str], user_specified_kind: bool
+) -> list[str]:
+    """
+    Drop cluster-scoped kinds when a namespace was given, unless the user asked for the kind.
+
+    A namespace filter cannot apply to namespaces/CRDs, so scanning them would
+    fetch every one in the cluster for a run the user scoped to one namespace.
+    """
+    if not namespace or user_specified_kind:
+        return types_to_scan
+    return [kind for kind in types_to_scan if kind not in CLUSTER_SCOPED_KINDS]
+
 
 def list_terminating(
     types_to_scan: list[str],
     namespace: Optional[str],
     name: Optional[str],
+    user_specified_kind: bool = False,
 ) -> None:
     """
     Print a simple list of resources stuck in Terminating.
 
     Args:
         types_to_scan: Kubectl plural kinds to scan (e.g. ["pods", "namespaces"]).
-        namespace: If set, limit namespaced resources to this namespace.
+        namespace: If set, limit namespaced resources to this namespace (and skip
+            cluster-scoped kinds unless user_specified_kind).
         name: If set, only consider the resource with this name.
+        user_specified_kind: True when the user named the resource type explicitly.
     """
-    print()
-    print(f"{BOLD}Resources stuck in Terminating{SGR0}")
-    print("----------------------------------------")
-    count = 0
-    for kind in types_to_scan:
-        obj = kubectl_get_json(
-            kind,
-            name=name,
-            namespace=namespace,
-            all_ns=(not namespace and kind not in CLUSTER_SCOPED_KINDS),
-        )
-        if not obj:
-            continue
-        for item in items_with_deletion(obj):
-            rname = item.get("metadata", {}).get("name", "?")
-            rns = item.get("metadata", {}).get("namespace", "") or ""
-            ns_suffix = f" (ns: {rns})" if rns else ""
-            print(f"  {kind}/{rname}{ns_suffix}")
-            count += 1
-    if count == 0:
-        print("  (none found)")
-    print()
-
-
-def _diagnose_finalizers(finalizers: list[str]) -> None:
+    types_to_scan = _scoped_kinds(types_to_scan, namespace, user_specified_kind)
+    buf = io.StringIO()
+    try:
+        print(file=buf)
+        print(f"{BOLD}Resources stuck in Terminating{SGR0}", file=buf)
+        print("----------------------------------------", file=buf)
+        count = 0
+        for kind, rows in _fetch_all(types_to_scan, namespace, name, fetch=_terminating_names):
+            for rns, rname, _ in rows:
+                ns_suffix = f" (ns: {rns})" if rns else ""
+                print(f"  {kind}/{rname}{ns_suffix}", file=buf)
+                count += 1
+        if count == 0:
+            print("  (none found)", file=buf)
+        print(file=buf)
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
+def _diagnose_finalizers(finalizers: list[str], out: TextIO) -> None:
     """Print finalizers only when present (actual reason deletion is blocked)."""
     if not finalizers:
-        print("  Finalizers: none")
+        print("  Finalizers: none", file=out)
     else:
-        print(f"  Finalizers: {', '.join(finalizers)}")
-        print("    -> A controller must complete and remove these before the resource can be removed.")
-        print("    -> Investigate which controller owns each finalizer before removing manually.")
+        print(f"  Finalizers: {', '.join(finalizers)}", file=out)
+        print("    -> A controller must complete and remove these before the resource can be removed.", file=out)
+        print("    -> Investigate which controller owns each finalizer before removing manually.", file=out)
+
+
+def _group_by_type(qualified_names: list[str]) -> dict[str, list[str]]:
+    """Bucket "type/name" strings by type, keeping first-seen order."""
+    buckets: dict[str, list[str]] = {}
+    for q in qualified_names:
+        resource_type, _, name = q.partition("/")
+        buckets.setdefault(resource_type, []).append(name)
+    return buckets
+
+
+def _fetch_finalizers(
+    resource_type: str, names: list[str], namespace: str
+) -> list[tuple[str, list[str]]]:
+    """
+    Return (type/name, finalizers) for each named resource of one type.
+
+    Fetches only the finalizers of the whole bucket with one kubectl call; if
+    that fails, falls back to each resource individually (full JSON only if the
+    jsonpath lookup fails too).
+    """
+    found = kubectl_get_many_finalizers(resource_type, names, namespace)
+    if found is not None:
+        return [(f"{resource_type}/{name}", finalizers) for name, finalizers in found.items()]
+    pairs: list[tuple[str, list[str]]] = []
+    for name in names:
+        q = f"{resource_type}/{name}"
+        # A one-name bucket already tried the jsonpath lookup
+        finalizers = kubectl_get_finalizers(q, namespace) if len(names) > 1 else None
+        if finalizers is None:
+            obj = kubectl_get_resource_json(q, namespace)
+            if not obj:
+                continue
+            finalizers = obj.get("metadata", {}).get("finalizers") or []
+        pairs.append((q, finalizers))
+    return pairs
 
 
 def diagnose_namespace(rname: str, verbose: bool, long_output: bool = False) -> None:
@@ -74,135 +175,168 @@ def diagnose_namespace(rname: str, verbose: bool, long_output: bool = False) ->
     optional unavailable API services (only when long_output is True), optional
     events (when verbose), and remediation command.
     """
-    print()
-    print(f"{BOLD}Namespace: {rname}{SGR0}")
-    print("----------------------------------------")
-    obj = kubectl_get_json("namespace", name=rname)
-    if not obj:
-        print("  (could not get namespace)")
-        return
-    meta = obj.get("metadata", {})
-    finalizers = meta.get("finalizers") or []
-    del_ts = meta.get("deletionTimestamp", "?")
-    print(f"  Deletion requested: {del_ts}")
-    _diagnose_finalizers(finalizers)
-
-    # Only show remaining resources when present (actual reason namespace is stuck).
-    # Group by resource type and use -o name so we get kind/name for remediation commands.
-    api_res_result = run_kubectl(["api-resources", "--verbs=list", "--namespaced", "-o", "name"])
-    if api_res_result.returncode == 0 and api_res_result.stdout:
-        resource_types = [r.strip() for r in api_res_result.stdout.strip().splitlines()]
-        remaining_by_kind: list[tuple[str, list[str]]] = []
-        for res in resource_types:
+    buf = io.StringIO()
+    try:
+        print(file=buf)
+        print(f"{BOLD}Namespace: {rname}{SGR0}", file=buf)
+        print("----------------------------------------", file=buf)
+        obj = kubectl_get_json("namespace", name=rname)
+        if not obj:
+            print("  (could not get namespace)", file=buf)
+            return
+        meta = obj.get("metadata", {})
+        finalizers = meta.get("finalizers") or []
+        del_ts = meta.get("deletionTimestamp", "?")
+        print(f"  Deletion requested: {del_ts}", file=buf)
+        _diagnose_finalizers(finalizers, buf)
+
+        # Only show remaining resources when present (actual reason namespace is stuck).
+        # Group by resource type and use -o name so we get kind/name for remediation commands.
+        resource_types = cached_api_resources()
+        if resource_types:
+
+            def _probe(res: str) -> list[str]:
+                get_result = run_kubectl(
+                    ["get", res, "-n", rname, "--ignore-not-found", "-o", "name", "--no-headers"]
+                )
+                if get_result.returncode != 0 or not get_result.stdout:
+                    return []
+                return [line.strip() for line in get_result.stdout.strip().splitlines() if line.strip()]
+
+            # One kubectl call lists every type (kubectl accepts "kind1,kind2,...").
+            # Fall back to per-type probes when it fails, e.g. one type lacks list permission.
             get_result = run_kubectl(
-                ["get", res, "-n", rname, "--ignore-not-found", "-o", "name", "--no-headers"]
+                ["get", ",".join(resource_types), "-n", rname, "--ignore-not-found", "-o", "name"]
             )
-            if get_result.returncode == 0 and get_result.stdout:
-                items = [line.strip() for line in get_result.stdout.strip().splitlines() if line.strip()]
-                if items:
-                    remaining_by_kind.append((res, items))
-        if remaining_by_kind:
-            print("  Remaining resources in namespace:")
-            max_resources = 50
-            all_qualified: list[str] = []
-            rows: list[tuple[str, str]] = []  # (resource_type, resource kind/name)
-            for kind, items in remaining_by_kind:
-                for item in items:
+            qualified: list[str]
+            if get_result.returncode == 0:
+                qualified = [line.strip() for line in get_result.stdout.strip().splitlines() if line.strip()]
+            else:
+                with ThreadPoolExecutor(max_workers=MAX_RESOURCE_WORKERS) as executor:
+                    qualified = [q for items in executor.map(_probe, resource_types) for q in items]
+            # Both paths label rows with the "-o name" prefix (e.g. "ingress.networking.k8s.io")
+            remaining_by_kind: list[tuple[str, list[str]]] = [
+                (res, [f"{res}/{n}" for n in names]) for res, names in _group_by_type(qualified).items()
+            ]
+            if remaining_by_kind:
+                print("  Remaining resources in namespace:", file=buf)
+                max_resources = 50
+                all_qualified: list[str] = []
+                rows: list[tuple[str, str]] = []  # (resource_type, resource kind/name)
+                for kind, items in remaining_by_kind:
+                    for item in items:
+                        if len(rows) >= max_resources:
+                            break
+                        rows.append((kind, item))
+                        all_qualified.append(item)
                     if len(rows) >= max_resources:
                         break
-                    rows.append((kind, item))
-                    all_qualified.append(item)
-                if len(rows) >= max_resources:
-                    break
-            total_remaining = sum(len(items) for _, items in remaining_by_kind)
-            # Table: RESOURCE TYPE | RESOURCE
-            col1_header = "RESOURCE TYPE"
-            col2_header = "RESOURCE"
-            w1 = max(len(col1_header), max(len(r[0]) for r in rows))
-            w2 = max(len(col2_header), max(len(r[1]) for r in rows))
-            fmt = f"    {{0:<{w1}}}  {{1:<{w2}}}"
-            print(fmt.format(col1_header, col2_header))
-            print(f"    {'-' * w1}  {'-' * w2}")
-            for kind, item in rows:
-                print(fmt.format(kind, item))
-            if total_remaining > max_resources:
-                print(f"    ... ({total_remaining - max_resources} more; run delete commands below then re-run term-dx)")
-
-            # Detect remaining resources that have finalizers (stuck terminating or will block delete,
-            # e.g. Ingress with group.ingress.k8s.aws/alb-controller-ingress-group)
-            stuck_remaining: list[tuple[str, list[str]]] = []
-            for q in all_qualified:
-                obj = kubectl_get_resource_json(q, rname)
-                if not obj:
-                    continue
-                meta = obj.get("metadata", {})
-                finalizers = meta.get("finalizers") or []
-                if finalizers:
-                    stuck_remaining.append((q, finalizers))
-            if stuck_remaining:
-                print("  Remaining resources that are stuck or have finalizers (blocking deletion):")
+                total_remaining = sum(len(items) for _, items in remaining_by_kind)
+                # Table: RESOURCE TYPE | RESOURCE
+                col1_header = "RESOURCE TYPE"
+                col2_header = "RESOURCE"
+                w1 = len(col1_header)
+                w2 = len(col2_header)
+                for kind, item in rows:
+                    w1 = max(w1, len(kind))
+                    w2 = max(w2, len(item))
+                print(f"    {col1_header.ljust(w1)}  {col2_header.ljust(w2)}", file=buf)
+                print(f"    {'-' * w1}  {'-' * w2}", file=buf)
+                for kind, item in rows:
+                    print(f"    {kind.ljust(w1)}  {item.ljust(w2)}", file=buf)
+                if total_remaining > max_resources:
+                    print(f"    ... ({total_remaining - max_resources} more; run delete commands below then re-run term-dx)", file=buf)
+
+                # Detect remaining resources that have finalizers (stuck terminating or will block delete,
+                # e.g. Ingress with group.ingress.k8s.aws/alb-controller-ingress-group)
+                stuck_remaining: list[tuple[str, list[str]]] = []
+                with ThreadPoolExecutor(max_workers=MAX_RESOURCE_WORKERS) as executor:
+                    finalizers_by_name = dict(
+                        pair
+                        for pairs in executor.map(
+                            lambda bucket: _fetch_finalizers(bucket[0], bucket[1], rname),
+                            _group_by_type(all_qualified).items(),
+                        )
+                        for pair in pairs
+                    )
+                for q in all_qualified:
+                    finalizers = finalizers_by_name.get(q)
+                    if finalizers:
+                        stuck_remaining.append((q, finalizers))
+                if stuck_remaining:
+                    print("  Remaining resources that are stuck or have finalizers (blocking deletion):", file=buf)
+                    rcol = "RESOURCE"
+                    fcol = "FINALIZERS"
+                    ccol = "COMMAND"
+                    # (resource, joined finalizers, patch command); widths tracked in one pass
+                    stuck_rows: list[tuple[str, str, str]] = []
+                    rw, fw, cw = len(rcol), len(fcol), len(ccol)
+                    for q, fin in stuck_remaining:
+                        fin_str = ", ".join(fin)
+                        cmd = f"kubectl patch {q} -n {rname} {PATCH_NULL_FINALIZERS}"
+                        stuck_rows.append((q, fin_str, cmd))
+                        rw = max(rw, len(q))
+                        fw = max(fw, len(fin_str))
+                        cw = max(cw, len(cmd))
+                    print(f"    {rcol.ljust(rw)}  {fcol.ljust(fw)}  {ccol.ljust(cw)}", file=buf)
+                    print(f"    {'-' * rw}  {'-' * fw}  {'-' * cw}", file=buf)
+                    for q, fin_str, cmd in stuck_rows:
+                        print(f"    {q.ljust(rw)}  {fin_str.ljust(fw)}  {cmd.ljust(cw)}", file=buf)
+
+                print("  Remediation (delete remaining resources):", file=buf)
+                # Table: RESOURCE | COMMAND
                 rcol = "RESOURCE"
-                fcol = "FINALIZERS"
                 ccol = "COMMAND"
-                rw = max(len(rcol), max(len(q) for q, _ in stuck_remaining))
-                fw = max(len(fcol), max(len(", ".join(f)) for _, f in stuck_remaining))
-                patch_cmds = [f"kubectl patch {q} -n {rname} -p '{{\"metadata\":{{\"finalizers\":null}}}}' --type=merge" for q, _ in stuck_remaining]
-                cw = max(len(ccol), max(len(c) for c in patch_cmds))
-                rfmt = f"    {{0:<{rw}}}  {{1:<{fw}}}  {{2:<{cw}}}"
-                print(rfmt.format(rcol, fcol, ccol))
-                print(f"    {'-' * rw}  {'-' * fw}  {'-' * cw}")
-                for (q, fin), cmd in zip(stuck_remaining, patch_cmds):
-                    print(rfmt.format(q, ", ".join(fin), cmd))
-
-            print("  Remediation (delete remaining resources):")
-            # Table: RESOURCE | COMMAND
-            del_commands = [f"kubectl delete {q} -n {rname}" for q in all_qualified]
-            rcol = "RESOURCE"
-            ccol = "COMMAND"
-            rw = max(len(rcol), max(len(q) for q in all_qualified))
-            cw = max(len(ccol), max(len(c) for c in del_commands))
-            rfmt = f"    {{0:<{rw}}}  {{1:<{cw}}}"
-            print(rfmt.format(rcol, ccol))
-            print(f"    {'-' * rw}  {'-' * cw}")
-            for q, cmd in zip(all_qualified, del_commands):
-                print(rfmt.format(q, cmd))
-            if total_remaining > max_resources:
-                print("    ... (more resources may remain; re-run term-dx after deleting above)")
-
-    # Unavailable API services only with --long (can be noisy; real blocker is rare)
-    if long_output:
-        api_result = run_kubectl(["get", "apiservices", "--no-headers"])
-        if api_result.returncode == 0 and api_result.stdout:
-            bad = [
-                line.split()[0]
-                for line in api_result.stdout.strip().splitlines()
-                if len(line.split()) >= 2 and line.split()[1] != "True"
-            ]
-            if bad:
-                print("  Unavailable API services:")
-                for b in bad:
-                    print(f"    {b}")
-
-    if verbose:
-        print("  Recent namespace events:")
-        ev_result = run_kubectl(
-            ["get", "events", "-n", rname, "--sort-by=.lastTimestamp", "--no-headers"]
-        )
-        if ev_result.returncode == 0 and ev_result.stdout:
-            for line in ev_result.stdout.strip().splitlines()[-10:]:
-                print(f"    {line}")
-        else:
-            print("    (none)")
-
-    patch_cmd_ns = f"kubectl patch namespace {rname} -p '{{\"metadata\":{{\"finalizers\":null}}}}' --type=merge"
-    action_ns = "Remove finalizers (last resort)"
-    print("  Remediation (namespace finalizers):")
-    aw = max(len("ACTION"), len(action_ns))
-    cw = max(len("COMMAND"), len(patch_cmd_ns))
-    print(f"    {'ACTION':<{aw}}  {'COMMAND':<{cw}}")
-    print(f"    {'-' * aw}  {'-' * cw}")
-    print(f"    {action_ns:<{aw}}  {patch_cmd_ns:<{cw}}")
-    print()
+                del_commands: list[str] = []
+                rw, cw = len(rcol), len(ccol)
+                for q in all_qualified:
+                    cmd = f"kubectl delete {q} -n {rname}"
+                    del_commands.append(cmd)
+                    rw = max(rw, len(q))
+                    cw = max(cw, len(cmd))
+                print(f"    {rcol.ljust(rw)}  {ccol.ljust(cw)}", file=buf)
+                print(f"    {'-' * rw}  {'-' * cw}", file=buf)
+                for q, cmd in zip(all_qualified, del_commands):
+                    print(f"    {q.ljust(rw)}  {cmd.ljust(cw)}", file=buf)
+                if total_remaining > max_resources:
+                    print("    ... (more resources may remain; re-run term-dx after deleting above)", file=buf)
+
+        # Unavailable API services only with --long (can be noisy; real blocker is rare)
+        if long_output:
+            api_result = run_kubectl(["get", "apiservices", "--no-headers"])
+            if api_result.returncode == 0 and api_result.stdout:
+                bad = [
+                    line.split()[0]
+                    for line in api_result.stdout.strip().splitlines()
+                    if len(line.split()) >= 2 and line.split()[1] != "True"
+                ]
+                if bad:
+                    print("  Unavailable API services:", file=buf)
+                    for b in bad:
+                        print(f"    {b}", file=buf)
+
+        if verbose:
+            print("  Recent namespace events:", file=buf)
+            ev_result = run_kubectl(
+                ["get", "events", "-n", rname, "--sort-by=.lastTimestamp", "--no-headers"]
+            )
+            if ev_result.returncode == 0 and ev_result.stdout:
+                for line in ev_result.stdout.strip().splitlines()[-10:]:
+                    print(f"    {line}", file=buf)
+            else:
+                print("    (none)", file=buf)
+
+        patch_cmd_ns = f"kubectl patch namespace {rname} {PATCH_NULL_FINALIZERS}"
+        action_ns = "Remove finalizers (last resort)"
+        print("  Remediation (namespace finalizers):", file=buf)
+        aw = max(len("ACTION"), len(action_ns))
+        cw = max(len("COMMAND"), len(patch_cmd_ns))
+        print(f"    {'ACTION':<{aw}}  {'COMMAND':<{cw}}", file=buf)
+        print(f"    {'-' * aw}  {'-' * cw}", file=buf)
+        print(f"    {action_ns:<{aw}}  {patch_cmd_ns:<{cw}}", file=buf)
+        print(file=buf)
+    finally:
+        sys.stdout.write(buf.getvalue())
 
 
 def diagnose_namespaced_resource(kind: str, rname: str, rns: str, verbose: bool) -> None:
@@ -212,66 +346,60 @@ def diagnose_namespaced_resource(kind: str, rname: str, rns: str, verbose: bool)
     Prints: deletion timestamp, finalizers, owner references, optional events,
     and the kubectl patch command to remove finalizers as last resort.
     """
-    print()
-    ns_label = f" (namespace: {rns})" if rns else ""
-    print(f"{BOLD}{kind}/{rname}{ns_label}{SGR0}")
-    print("----------------------------------------")
-    obj = kubectl_get_json(kind, name=rname, namespace=rns or None)
-    if not obj:
-        print("  (could not get resource)")
-        return
-    meta = obj.get("metadata", {})
-    finalizers = meta.get("finalizers") or []
-    del_ts = meta.get("deletionTimestamp", "?")
-    print(f"  Deletion requested: {del_ts}")
-    _diagnose_finalizers(finalizers)
-
-    # Owner refs (e.g. Deployment) may explain why the resource exists or is stuck
-    owners = meta.get("ownerReferences") or []
-    if owners:
-        owner_str = ", ".join(f"{o.get('kind', '')}/{o.get('name', '')}" for o in owners)
-        print(f"  Owner(s): {owner_str}")
-
-    if verbose:
-        print("  Recent events:")
-        args = [
-            "get",
-            "events",
-            "--field-selector",
-            f"involvedObject.name={rname}",
-            "--sort-by=.lastTimestamp",
-            "--no-headers",
-        ]
-        if rns:
-            args = [
-                "get",
-                "events",
-                "-n",
-                rns,
+    buf = io.StringIO()
+    try:
+        print(file=buf)
+        ns_label = f" (namespace: {rns})" if rns else ""
+        print(f"{BOLD}{kind}/{rname}{ns_label}{SGR0}", file=buf)
+        print("----------------------------------------", file=buf)
+        obj = kubectl_get_json(kind, name=rname, namespace=rns or None)
+        if not obj:
+            print("  (could not get resource)", file=buf)
+            return
+        meta = obj.get("metadata", {})
+        finalizers = meta.get("finalizers") or []
+        del_ts = meta.get("deletionTimestamp", "?")
+        print(f"  Deletion requested: {del_ts}", file=buf)
+        _diagnose_finalizers(finalizers, buf)
+
+        # Owner refs (e.g. Deployment) may explain why the resource exists or is stuck
+        owners = meta.get("ownerReferences") or []
+        if owners:
+            owner_str = ", ".join(f"{o.get('kind', '')}/{o.get('name', '')}" for o in owners)
+            print(f"  Owner(s): {owner_str}", file=buf)
+
+        if verbose:
+            print("  Recent events:", file=buf)
+            args = ["get", "events"]
+            if rns:
+                args += ["-n", rns]
+            args += [
                 "--field-selector",
                 f"involvedObject.name={rname}",
                 "--sort-by=.lastTimestamp",
                 "--no-headers",
             ]
-        ev_result = run_kubectl(args)
-        if ev_result.returncode == 0 and ev_result.stdout:
-            for line in ev_result.stdout.strip().splitlines()[-10:]:
-                print(f"    {line}")
-        else:
-            print("    (none)")
-
-    patch_cmd = f"kubectl patch {kind} {rname}"
-    if rns:
-        patch_cmd += f" -n {rns}"
-    patch_cmd += " -p '{\"metadata\":{\"finalizers\":null}}' --type=merge"
-    action = "Remove finalizers (last resort)"
-    print("  Remediation (finalizers):")
-    aw = max(len("ACTION"), len(action))
-    cw = max(len("COMMAND"), len(patch_cmd))
-    print(f"    {'ACTION':<{aw}}  {'COMMAND':<{cw}}")
-    print(f"    {'-' * aw}  {'-' * cw}")
-    print(f"    {action:<{aw}}  {patch_cmd:<{cw}}")
-    print()
+            ev_result = run_kubectl(args)
+            if ev_result.returncode == 0 and ev_result.stdout:
+                for line in ev_result.stdout.strip().splitlines()[-10:]:
+                    print(f"    {line}", file=buf)
+            else:
+                print("    (none)", file=buf)
+
+        patch_parts = ["kubectl", "patch", kind, rname]
+        if rns:
+            patch_parts += ["-n", rns]
+        patch_cmd = " ".join([*patch_parts, PATCH_NULL_FINALIZERS])
+        action = "Remove finalizers (last resort)"
+        print("  Remediation (finalizers):", file=buf)
+        aw = max(len("ACTION"), len(action))
+        cw = max(len("COMMAND"), len(patch_cmd))
+        print(f"    {'ACTION':<{aw}}  {'COMMAND':<{cw}}", file=buf)
+        print(f"    {'-' * aw}  {'-' * cw}", file=buf)
+        print(f"    {action:<{aw}}  {patch_cmd:<{cw}}", file=buf)
+        print(file=buf)
+    finally:
+        sys.stdout.write(buf.getvalue())
 
 
 def run_diagnosis(
@@ -280,26 +408,24 @@ def run_diagnosis(
     name: Optional[str],
     verbose: bool,
     long_output: bool = False,
+    user_specified_kind: bool = False,
 ) -> None:
     """
     Find all terminating resources of the given kinds and run full diagnosis for each.
 
     Args:
         types_to_scan: Kubectl plural kinds to scan.
-        namespace: Optional namespace filter for namespaced kinds.
+        namespace: Optional namespace filter for namespaced kinds; when set,
+            cluster-scoped kinds are skipped unless user_specified_kind.
         name: Optional resource name to restrict to a single resource.
         verbose: If True, include recent events in each diagnosis.
         long_output: If True, include all info (e.g. unavailable API services for namespaces).
+        user_specified_kind: True when the user named the resource type explicitly.
     """
+    types_to_scan = _scoped_kinds(types_to_scan, namespace, user_specified_kind)
     found = 0
-    for kind in types_to_scan:
-        # Cluster-scoped kinds (namespaces, CRDs) use neither -n nor -A
-        use_ns = namespace if kind not in CLUSTER_SCOPED_KINDS else None
-        all_ns = not use_ns and kind not in CLUSTER_SCOPED_KINDS
-        obj = kubectl_get_json(kind, name=name, namespace=use_ns, all_ns=all_ns)
-        if not obj:
-            continue
-        for item in items_with_deletion(obj):
+    for kind, items in _fetch_all(types_to_scan, namespace, name):
+        for item in items:
             meta = item.get("metadata", {})
             rname = meta.get("name", "")
             rns = meta.get("namespace") or ""
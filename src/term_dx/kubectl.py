@@ -1,40 +1,415 @@
 """
 Kubectl invocation and Kubernetes resource JSON helpers.
 
-All cluster access goes through subprocess kubectl calls. This module
-provides a small wrapper and helpers to fetch resources as JSON and
+Cluster access goes through subprocess kubectl calls. Named lookups of the
+built-in kinds term-dx scans are served over a persistent connection instead
+when possible: through the optional kubernetes Python client if installed,
+otherwise through a single "kubectl proxy" started for the run (see
+kubectl_proxy()). Either falls back to kubectl subprocess calls on any error;
+list scans always use kubectl so its deletionTimestamp filter applies. This
+module provides a small wrapper and helpers to fetch resources as JSON and
 filter for those with a deletion timestamp (stuck terminating).
 """
 
 from __future__ import annotations
 
+import contextlib
+import copy
+import functools
+import hashlib
+import http.client
 import json
+import os
+import queue
+import re
+import shutil
 import subprocess
-from typing import Optional
+import tempfile
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Generator, Iterator, Optional, Union
 
-from .config import CLUSTER_SCOPED_KINDS
+from .config import API_RESOURCES_CACHE_TTL, CLUSTER_SCOPED_KINDS, RESOURCE_ALIASES
 
+try:
+    import ijson
+except ImportError:  # optional: pip install term-dx[stream]
+    ijson = None
 
-def run_kubectl(args: list[str], capture: bool = True) -> subprocess.CompletedProcess:
+try:
+    import orjson
+except ImportError:  # optional: pip install term-dx[fast-json]
+    orjson = None
+
+try:
+    from kubernetes import client as k8s_client
+    from kubernetes import config as k8s_config
+except ImportError:  # optional: pip install term-dx[client]
+    k8s_client = None
+    k8s_config = None
+
+# Built-in kinds whose named reads can skip kubectl: REST path prefix (for
+# kubectl proxy) and kubernetes client (API class, read method). Namespaced
+# unless listed in CLUSTER_SCOPED_KINDS. List scans stay on the filtered
+# kubectl path.
+_NAMED_READS = {
+    "namespaces": ("/api/v1", "CoreV1Api", "read_namespace"),
+    "customresourcedefinitions": (
+        "/apis/apiextensions.k8s.io/v1",
+        "ApiextensionsV1Api",
+        "read_custom_resource_definition",
+    ),
+    "pods": ("/api/v1", "CoreV1Api", "read_namespaced_pod"),
+    "services": ("/api/v1", "CoreV1Api", "read_namespaced_service"),
+    "persistentvolumeclaims": ("/api/v1", "CoreV1Api", "read_namespaced_persistent_volume_claim"),
+    "configmaps": ("/api/v1", "CoreV1Api", "read_namespaced_config_map"),
+    "secrets": ("/api/v1", "CoreV1Api", "read_namespaced_secret"),
+}
+
+# Connection pool size for the kubernetes client (matches the widest thread pool in diagnose).
+_CLIENT_POOL_SIZE = 16
+
+# Seconds to wait for "kubectl proxy" to report its listen address.
+_PROXY_START_TIMEOUT = 10
+
+# Address of the running kubectl proxy ("127.0.0.1:PORT"), set by kubectl_proxy().
+_proxy_addr: Optional[str] = None
+# One keep-alive HTTP connection to the proxy per thread (http.client is not thread-safe).
+_proxy_conns = threading.local()
+
+# Memoized kubectl_get_json() results keyed by (kind, name, namespace); see clear_cache().
+_json_cache: dict[tuple[str, Optional[str], Optional[str]], dict] = {}
+_json_cache_lock = threading.Lock()
+
+# Prints one finalizer per line for a single resource.
+_FINALIZERS_OUTPUT = 'jsonpath={range .metadata.finalizers[*]}{@}{"\\n"}{end}'
+
+# Prints "name<TAB>finalizer1,finalizer2," for one object, or per item of a List.
+_NAME_FINALIZERS = '{.metadata.name}{"\\t"}{range .metadata.finalizers[*]}{@}{","}{end}{"\\n"}'
+_OBJECT_FINALIZERS_OUTPUT = "jsonpath=" + _NAME_FINALIZERS
+_MANY_FINALIZERS_OUTPUT = "jsonpath={range .items[*]}" + _NAME_FINALIZERS + "{end}"
+
+# Resolved once so each subprocess call skips the PATH search.
+_KUBECTL = shutil.which("kubectl") or "kubectl"
+
+# kubectl-side filter for list responses: only items with a deletion timestamp,
+# printed as a JSON array. The apiserver does not support a field selector on
+# metadata.deletionTimestamp, so this is the closest thing to a server-side filter.
+_TERMINATING_OUTPUT = "jsonpath-as-json={.items[?(@.metadata.deletionTimestamp)]}"
+
+# Same filter, printing only "namespace|name|deletionTimestamp" per line.
+_NAME_FIELDS = "{.metadata.namespace}|{.metadata.name}|{.metadata.deletionTimestamp}"
+_TERMINATING_NAMES_OUTPUT = (
+    "jsonpath={range .items[?(@.metadata.deletionTimestamp)]}" + _NAME_FIELDS + "{\"\\n\"}{end}"
+)
+
+
+def run_kubectl(
+    args: list[str], capture: bool = True, text: bool = True
+) -> subprocess.CompletedProcess:
     """
     Run kubectl with the given args.
 
     Args:
         args: List of arguments (e.g. ["get", "pods", "-A", "-o", "json"]).
         capture: If True, capture stdout/stderr; otherwise inherit from process.
+        text: If True, decode output to str; if False, stdout/stderr are bytes
+            (used for JSON output, which is parsed straight from bytes).
 
     Returns:
         CompletedProcess with returncode, stdout, stderr. Times out after 60s.
     """
-    cmd = ["kubectl"] + args
+    cmd = [_KUBECTL, *args]
+    # Our own fds are non-inheritable (PEP 446), so skip closing fds in the child
     return subprocess.run(
         cmd,
         capture_output=capture,
-        text=True,
+        text=text,
         timeout=60,
+        close_fds=False,
     )
 
 
+def _loads(data: Union[str, bytes]):
+    """
+    Parse JSON with orjson when installed, else the stdlib json module.
+
+    Raises json.JSONDecodeError on invalid input (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _api(api_class: str):
+    """
+    Return a kubernetes client API object (e.g. CoreV1Api), or None.
+
+    None means the kubernetes package is not installed or no kubeconfig could be
+    loaded; callers then fall back to kubectl. The underlying ApiClient (and its
+    connection pool) is shared by all API objects.
+    """
+    api_client = _api_client()
+    if api_client is None:
+        return None
+    return getattr(k8s_client, api_class)(api_client)
+
+
+@functools.lru_cache(maxsize=None)
+def _api_client():
+    """Build the shared kubernetes ApiClient from the current kubeconfig context, or None."""
+    if k8s_client is None:
+        return None
+    configuration = k8s_client.Configuration()
+    try:
+        k8s_config.load_kube_config(client_configuration=configuration)
+    except Exception:
+        return None
+    configuration.connection_pool_maxsize = _CLIENT_POOL_SIZE
+    return k8s_client.ApiClient(configuration)
+
+
+def _client_get(kind: str, name: Optional[str], namespace: Optional[str]) -> Optional[dict]:
+    """
+    Read one named resource of a built-in kind through the kubernetes client.
+
+    List requests are not served here: an unpaginated list of every pod or
+    secret would bypass the kubectl-side deletionTimestamp filter. Responses are
+    read raw (_preload_content=False) and parsed with json, so the dicts match
+    "kubectl get -o json" output exactly.
+
+    Returns:
+        Parsed JSON for the resource, {} if it does not exist, or None when no
+        name is given, the client is unavailable, the kind is not supported
+        here, or the request fails (callers fall back to kubectl).
+    """
+    plural = RESOURCE_ALIASES.get(kind, kind)
+    read = _NAMED_READS.get(plural)
+    if not name or read is None:
+        return None
+    _, api_class, method = read
+    namespaced = plural not in CLUSTER_SCOPED_KINDS
+    if namespaced and not namespace:
+        return None
+    api = _api(api_class)
+    if api is None:
+        return None
+    args = (name, namespace) if namespaced else (name,)
+    try:
+        response = getattr(api, method)(*args, _preload_content=False)
+        return _loads(response.data)
+    except k8s_client.ApiException as e:
+        if e.status == 404:
+            return {}
+        return None
+    except Exception:
+        return None
+
+
+@contextlib.contextmanager
+def kubectl_proxy() -> Iterator[Optional[str]]:
+    """
+    Run "kubectl proxy" for the duration of the block.
+
+    While active, named lookups of built-in kinds are plain HTTP GETs over
+    keep-alive connections to the proxy, so many lookups share one kubectl
+    process and one TLS session to the apiserver. List scans still use kubectl.
+    Does nothing when the kubernetes client is available (it already keeps a
+    connection pool). Opt-in (term-dx --proxy): the proxy listens on an
+    unauthenticated 127.0.0.1 port with the user's credentials while it runs.
+
+    Yields:
+        The proxy address ("127.0.0.1:PORT"), or None if the proxy was not
+        started (lookups then use kubectl subprocesses as usual).
+    """
+    global _proxy_addr
+    if _api_client() is not None:
+        yield None
+        return
+    try:
+        proc = subprocess.Popen(
+            [_KUBECTL, "proxy", "--port=0"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            close_fds=False,
+        )
+    except OSError:
+        yield None
+        return
+    try:
+        _proxy_addr = _wait_for_proxy(proc)
+        yield _proxy_addr
+    finally:
+        _proxy_addr = None
+        proc.kill()
+        proc.wait()
+
+
+def _wait_for_proxy(proc: subprocess.Popen) -> Optional[str]:
+    """Return the address from "Starting to serve on HOST:PORT", or None on timeout/exit."""
+    lines: queue.Queue = queue.Queue()
+
+    def _reader() -> None:
+        # Keep draining stdout so the proxy never blocks on a full pipe
+        for line in proc.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    threading.Thread(target=_reader, daemon=True).start()
+    deadline = time.monotonic() + _PROXY_START_TIMEOUT
+    while True:
+        try:
+            line = lines.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            return None
+        if line is None:
+            return None
+        match = re.search(r"Starting to serve on (\S+)", line)
+        if match:
+            return match.group(1)
+
+
+def _proxy_get(kind: str, name: Optional[str], namespace: Optional[str]) -> Optional[dict]:
+    """
+    Read one named resource of a built-in kind through the running kubectl proxy.
+
+    Returns:
+        Parsed JSON for the resource, {} if the apiserver reports it NotFound,
+        or None when no name is given, no proxy is running, the kind is not
+        supported here, or the request fails (callers fall back to kubectl).
+    """
+    addr = _proxy_addr
+    plural = RESOURCE_ALIASES.get(kind, kind)
+    read = _NAMED_READS.get(plural)
+    if not name or addr is None or read is None:
+        return None
+    prefix = read[0]
+    namespaced = plural not in CLUSTER_SCOPED_KINDS
+    if namespaced and not namespace:
+        return None
+    path = prefix
+    if namespaced:
+        path += f"/namespaces/{urllib.parse.quote(namespace, safe='')}"
+    path += f"/{plural}/{urllib.parse.quote(name, safe='')}"
+    conn = getattr(_proxy_conns, "conn", None)
+    if conn is None or getattr(_proxy_conns, "addr", None) != addr:
+        conn = http.client.HTTPConnection(addr, timeout=60)
+        _proxy_conns.conn, _proxy_conns.addr = conn, addr
+    try:
+        conn.request("GET", path, headers={"Accept": "application/json"})
+        response = conn.getresponse()
+        body = response.read()
+    except (OSError, http.client.HTTPException):
+        conn.close()
+        _proxy_conns.conn = None
+        return None
+    if response.status not in (200, 404):
+        return None
+    try:
+        obj = _loads(body)
+    except json.JSONDecodeError:
+        return None
+    if response.status == 404:
+        # Only the apiserver's NotFound Status for this object means it is missing;
+        # any other 404 (e.g. the group/version is not served) falls back to kubectl
+        if (
+            isinstance(obj, dict)
+            and obj.get("reason") == "NotFound"
+            and (obj.get("details") or {}).get("name") == name
+        ):
+            return {}
+        return None
+    return obj
+
+
+def _api_get(kind: str, name: Optional[str], namespace: Optional[str]) -> Optional[dict]:
+    """Read a named built-in resource over a persistent connection (client, then proxy); None to use kubectl."""
+    obj = _client_get(kind, name, namespace)
+    if obj is None:
+        obj = _proxy_get(kind, name, namespace)
+    return obj
+
+
+def run_kubectl_stream(args: list[str], stderr=subprocess.DEVNULL) -> subprocess.Popen:
+    """
+    Start kubectl with the given args and return the running process.
+
+    Use for large responses that should be parsed incrementally: read from
+    proc.stdout (bytes), then wait() on the process.
+
+    Args:
+        args: List of arguments (e.g. ["get", "pods", "-A", "-o", "json"]).
+        stderr: Where kubectl's stderr goes (discarded by default). Pass a file,
+            not a pipe, since stdout is read to EOF before anything else.
+
+    Returns:
+        Popen with stdout as a binary pipe. kubectl gives up on the request
+        after 60s, matching run_kubectl(), so a stalled apiserver cannot block
+        the reader forever.
+    """
+    # kubectl's own --request-timeout defaults to 0 (no limit)
+    cmd = [_KUBECTL, *args, "--request-timeout=60s"]
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, close_fds=False)
+
+
+def _cache_dir() -> Path:
+    """Directory for term-dx cache files ($XDG_CACHE_HOME/term-dx or ~/.cache/term-dx)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "term-dx"
+
+
+def cached_api_resources() -> Optional[list[str]]:
+    """
+    List namespaced, listable API resource types, cached on disk per context.
+
+    Runs "kubectl api-resources --verbs=list --namespaced -o name" and caches the
+    result for API_RESOURCES_CACHE_TTL seconds, keyed by kubeconfig and current
+    context, since the set of API resources changes rarely.
+
+    Returns:
+        Resource type names (e.g. ["pods", "ingresses.networking.k8s.io"]), or
+        None if kubectl api-resources fails.
+    """
+    cache_file: Optional[Path] = None
+    ctx_result = run_kubectl(["config", "current-context"])
+    if ctx_result.returncode == 0 and ctx_result.stdout.strip():
+        key = f"{os.environ.get('KUBECONFIG', '')}\0{ctx_result.stdout.strip()}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        cache_file = _cache_dir() / f"api-resources-{digest}.txt"
+        try:
+            if time.time() - cache_file.stat().st_mtime < API_RESOURCES_CACHE_TTL:
+                cached = [r.strip() for r in cache_file.read_text().splitlines() if r.strip()]
+                if cached:
+                    return cached
+        except OSError:
+            pass
+
+    result = run_kubectl(["api-resources", "--verbs=list", "--namespaced", "-o", "name"])
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    resource_types = [r.strip() for r in result.stdout.strip().splitlines() if r.strip()]
+
+    if cache_file is not None:
+        # Write to a temp file and rename so concurrent runs never read a partial file
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_file.parent, prefix=".api-resources-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write("\n".join(resource_types) + "\n")
+                os.replace(tmp, cache_file)
+            except OSError:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+    return resource_types
+
+
 def kubectl_get_json(
     kind: str,
     name: Optional[str] = None,
@@ -44,6 +419,10 @@ def kubectl_get_json(
     """
     Get one or more resources as JSON.
 
+    Successful results are memoized for the life of the process (see
+    clear_cache()), so repeated lookups of the same kind/name/namespace do not
+    re-run kubectl. Kind aliases (e.g. "namespace") share the plural's entry.
+
     Args:
         kind: Resource kind (plural), e.g. "pods", "namespaces".
         name: Optional specific resource name.
@@ -52,10 +431,52 @@ def kubectl_get_json(
 
     Returns:
         Parsed JSON dict (List-style with "items" or single object), or None on
-        failure / missing resource / invalid JSON.
+        failure / missing resource / invalid JSON. Each call returns a fresh copy,
+        so callers may mutate it.
     """
-    args = ["get", kind, "-o", "json"]
-    # Cluster-scoped kinds (namespaces, CRDs) use neither -n nor -A
+    # Normalize aliases so "namespace" and "namespaces" share a cache entry
+    kind = RESOURCE_ALIASES.get(kind, kind)
+    key = (kind, name, _scoped_namespace(kind, namespace))
+    with _json_cache_lock:
+        cached = _json_cache.get(key)
+    if cached is None:
+        cached = _get_json_uncached(*key)
+        if cached is None:
+            # Failures are not cached so a transient error is retried on the next call
+            return None
+        with _json_cache_lock:
+            _json_cache[key] = cached
+    return copy.deepcopy(cached)
+
+
+def _get_json_uncached(
+    kind: str, name: Optional[str], namespace: Optional[str]
+) -> Optional[dict]:
+    """Body of kubectl_get_json() without memoization."""
+    obj = _api_get(kind, name, namespace)
+    if obj is not None:
+        return obj or None
+    result = run_kubectl(_get_args(kind, name, namespace), text=False)
+    if result.returncode != 0 or not result.stdout:
+        return None
+    try:
+        return _loads(result.stdout)
+    except json.JSONDecodeError:
+        return None
+
+
+def _scoped_namespace(kind: str, namespace: Optional[str]) -> Optional[str]:
+    """Return namespace, or None for cluster-scoped kinds (namespaces, CRDs) that take no -n."""
+    return None if RESOURCE_ALIASES.get(kind, kind) in CLUSTER_SCOPED_KINDS else namespace
+
+
+def _get_args(
+    kind: str, name: Optional[str], namespace: Optional[str], output: str = "json"
+) -> list[str]:
+    """Build "kubectl get <kind> -o <output>" args with the right -n / -A scoping."""
+    kind = RESOURCE_ALIASES.get(kind, kind)
+    args = ["get", kind, "-o", output]
+    # Cluster-scoped kinds use neither -n nor -A
     if kind in CLUSTER_SCOPED_KINDS:
         pass
     elif namespace:
@@ -64,13 +485,158 @@ def kubectl_get_json(
         args.append("-A")
     if name:
         args.append(name)
-    result = run_kubectl(args)
-    if result.returncode != 0 or not result.stdout:
-        return None
+    return args
+
+
+def _stream_terminating_items(
+    args: list[str], prefix: str, stderr=subprocess.DEVNULL
+) -> Generator[dict, None, int]:
+    """
+    Run kubectl and yield the terminating objects found at prefix in its JSON output.
+
+    prefix is an ijson path: "item" for a top-level array (jsonpath-as-json
+    output), "items.item" for a List. Parsing is incremental when ijson is
+    installed. Items are checked for a deletion timestamp here as well, in case
+    kubectl's own filter was not applied.
+
+    Returns:
+        kubectl's exit code (the generator's return value).
+    """
+    proc = run_kubectl_stream(args, stderr=stderr)
     try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
-        return None
+        if ijson is not None:
+            try:
+                for item in ijson.items(proc.stdout, prefix, use_float=True):
+                    m = item.get("metadata")
+                    if m and m.get("deletionTimestamp"):
+                        yield item
+            except ijson.JSONError:
+                pass  # empty or truncated output; exit code decides
+        else:
+            try:
+                obj = _loads(proc.stdout.read())
+            except json.JSONDecodeError:
+                obj = None
+            if prefix == "item":
+                items = obj if isinstance(obj, list) else []
+            else:
+                items = (obj.get("items") if isinstance(obj, dict) else None) or []
+            yield from iter_items_with_deletion({"items": items})
+    finally:
+        proc.stdout.close()
+        try:
+            proc.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    return proc.returncode
+
+
+def _collect_terminating_items(args: list[str], prefix: str) -> tuple[list[dict], int, str]:
+    """Run _stream_terminating_items() to the end; return (items, exit code, stderr)."""
+    items: list[dict] = []
+    with tempfile.TemporaryFile() as err:
+        stream = _stream_terminating_items(args, prefix, stderr=err)
+        while True:
+            try:
+                items.append(next(stream))
+            except StopIteration as done:
+                returncode = done.value
+                break
+        err.seek(0)
+        return items, returncode, err.read().decode(errors="replace")
+
+
+def kubectl_stream_terminating(
+    kind: str,
+    name: Optional[str] = None,
+    namespace: Optional[str] = None,
+) -> Iterator[dict]:
+    """
+    Yield resources of a kind that have a deletion timestamp.
+
+    List requests (no name) ask kubectl to filter with a jsonpath expression so
+    only terminating items are printed, and that output is stream-parsed (with
+    ijson when installed). Its items are kept only if kubectl exits 0, so a
+    failed run never yields partial results. Only when kubectl rejects the
+    output format (older kubectl without jsonpath-as-json) is the full list
+    streamed and filtered here instead. A named lookup goes through
+    kubectl_get_json().
+
+    Args:
+        kind: Resource kind (plural), e.g. "pods", "namespaces".
+        name: Optional specific resource name.
+        namespace: Optional namespace; used only for namespaced kinds.
+
+    Yields:
+        Resource dicts that are in Terminating state. Yields nothing on failure.
+    """
+    if name:
+        obj = kubectl_get_json(kind, name=name, namespace=namespace)
+        if obj:
+            yield from iter_items_with_deletion(obj)
+        return
+    items, returncode, stderr = _collect_terminating_items(
+        _get_args(kind, None, namespace, output=_TERMINATING_OUTPUT), "item"
+    )
+    if returncode == 0:
+        yield from items
+    elif not items and "output format" in stderr:
+        # kubectl without jsonpath-as-json: stream the full list and filter here
+        yield from _stream_terminating_items(_get_args(kind, None, namespace), "items.item")
+
+
+def kubectl_get_terminating_names(
+    kind: str,
+    name: Optional[str] = None,
+    namespace: Optional[str] = None,
+) -> list[tuple[str, str, str]]:
+    """
+    List terminating resources of a kind as (namespace, name, deletionTimestamp).
+
+    Uses a jsonpath output so kubectl prints only those three fields instead
+    of full objects; use kubectl_stream_terminating() when finalizers or owners
+    are needed.
+
+    Args:
+        kind: Resource kind (plural), e.g. "pods", "namespaces".
+        name: Optional specific resource name.
+        namespace: Optional namespace; used only for namespaced kinds.
+
+    Returns:
+        One tuple per terminating resource (namespace is "" for cluster-scoped
+        kinds), or an empty list on failure.
+    """
+    if name:
+        obj = _api_get(kind, name, namespace)
+        if obj is not None:
+            return [
+                (
+                    item["metadata"].get("namespace") or "",
+                    item["metadata"].get("name") or "",
+                    item["metadata"]["deletionTimestamp"],
+                )
+                for item in (items_with_deletion(obj) if obj else [])
+            ]
+    output = f"jsonpath={_NAME_FIELDS}" if name else _TERMINATING_NAMES_OUTPUT
+    result = run_kubectl(_get_args(kind, name, namespace, output=output))
+    if result.returncode != 0 or not result.stdout:
+        return []
+    rows: list[tuple[str, str, str]] = []
+    for line in result.stdout.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3:
+            continue
+        rns, rname, del_ts = parts
+        if rname and del_ts:
+            rows.append((rns, rname, del_ts))
+    return rows
+
+
+def clear_cache() -> None:
+    """Forget memoized kubectl_get_json() results (called at the start of each run)."""
+    with _json_cache_lock:
+        _json_cache.clear()
 
 
 def kubectl_get_resource_json(qualified_name: str, namespace: str) -> Optional[dict]:
@@ -90,27 +656,91 @@ def kubectl_get_resource_json(qualified_name: str, namespace: str) -> Optional[d
         Parsed JSON dict for the resource, or None on failure / missing / invalid JSON.
     """
     result = run_kubectl(
-        ["get", qualified_name, "-n", namespace, "-o", "json"]
+        ["get", qualified_name, "-n", namespace, "-o", "json"], text=False
     )
     if result.returncode == 0 and result.stdout:
         try:
-            return json.loads(result.stdout)
+            return _loads(result.stdout)
         except json.JSONDecodeError:
             pass
     # Fallback: some resources (e.g. Ingress) need type and name as separate args
     if "/" in qualified_name:
         resource_type, name = qualified_name.split("/", 1)
         result = run_kubectl(
-            ["get", resource_type, name, "-n", namespace, "-o", "json"]
+            ["get", resource_type, name, "-n", namespace, "-o", "json"], text=False
         )
         if result.returncode == 0 and result.stdout:
             try:
-                return json.loads(result.stdout)
+                return _loads(result.stdout)
             except json.JSONDecodeError:
                 pass
     return None
 
 
+def kubectl_get_finalizers(qualified_name: str, namespace: str) -> Optional[list[str]]:
+    """
+    Get only the finalizers of a single namespaced resource.
+
+    Uses a jsonpath output so kubectl prints just the finalizer names rather
+    than the whole object (which can be tens of KB with managedFields).
+
+    Args:
+        qualified_name: Resource in "kind/name" or "kind.api/name" form.
+        namespace: Namespace the resource lives in.
+
+    Returns:
+        Finalizer names (empty if none or if the resource is gone), or None on
+        failure so callers can fall back to kubectl_get_resource_json().
+    """
+    # Pass type and name separately; some resources (e.g. Ingress) need it
+    resource_type, _, name = qualified_name.partition("/")
+    target = [resource_type, name] if name else [qualified_name]
+    result = run_kubectl(
+        ["get", *target, "-n", namespace, "--ignore-not-found", "-o", _FINALIZERS_OUTPUT]
+    )
+    if result.returncode != 0:
+        return None
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+def kubectl_get_many_finalizers(
+    resource_type: str, names: list[str], namespace: str
+) -> Optional[dict[str, list[str]]]:
+    """
+    Get the finalizers of several resources of one type in a single kubectl call.
+
+    Runs "kubectl get <resource_type> <name1> <name2> ... -n <ns>" with a
+    jsonpath output that prints only each name and its finalizers, so N lookups
+    cost one process and one round-trip and no full manifests are transferred.
+
+    Args:
+        resource_type: Resource type as printed by "kubectl get -o name" (e.g.
+            "ingress.networking.k8s.io", "pod").
+        names: Resource names (without the "type/" prefix).
+        namespace: Namespace the resources live in.
+
+    Returns:
+        Mapping of resource name to finalizers (empty list if none; missing
+        resources are omitted), or None on failure so callers can fall back to
+        per-resource lookups.
+    """
+    if not names:
+        return {}
+    # A single name yields the object itself rather than a List, so .items is absent
+    output = _OBJECT_FINALIZERS_OUTPUT if len(names) == 1 else _MANY_FINALIZERS_OUTPUT
+    result = run_kubectl(
+        ["get", resource_type, *names, "-n", namespace, "--ignore-not-found", "-o", output]
+    )
+    if result.returncode != 0:
+        return None
+    found: dict[str, list[str]] = {}
+    for line in result.stdout.splitlines():
+        name, sep, rest = line.partition("\t")
+        if sep and name:
+            found[name] = [f for f in rest.split(",") if f]
+    return found
+
+
 def items_with_deletion(obj: dict) -> list[dict]:
     """
     Return only items that have a deletion timestamp (stuck terminating).
@@ -124,9 +754,19 @@ def items_with_deletion(obj: dict) -> list[dict]:
     Returns:
         List of resource dicts that are in Terminating state.
     """
-    if "items" in obj:
-        return [i for i in obj["items"] if i.get("metadata", {}).get("deletionTimestamp")]
-    meta = obj.get("metadata", {})
-    if meta.get("deletionTimestamp"):
-        return [obj]
-    return []
+    items = obj.get("items")
+    if items is not None:
+        return [i for i in items if (m := i.get("metadata")) and m.get("deletionTimestamp")]
+    m = obj.get("metadata")
+    return [obj] if m and m.get("deletionTimestamp") else []
+
+
+def iter_items_with_deletion(obj: dict) -> Iterator[dict]:
+    """Lazy variant of items_with_deletion() for callers that consume items one at a time."""
+    items = obj.get("items")
+    if items is None:
+        items = (obj,)
+    for i in items:
+        m = i.get("metadata")
+        if m and m.get("deletionTimestamp"):
+            yield i
@@ -0,0 +1,42 @@
+"""Shared pytest fixtures for term-dx tests."""
+
+import contextlib
+import subprocess
+import sys
+
+import pytest
+
+from term_dx import cli, kubectl
+
+
+@pytest.fixture(autouse=True)
+def _kubectl_subprocess_only(monkeypatch):
+    """
+    Keep tests on the kubectl subprocess path even if the kubernetes client,
+    kubectl and a kubeconfig are present.
+    """
+    monkeypatch.setattr(kubectl, "_api_get", lambda kind, name, namespace: None)
+    monkeypatch.setattr(cli, "kubectl_proxy", contextlib.nullcontext)
+
+
+def _streamed(stdout: bytes, returncode: int = 0, stderr=None, err: bytes = b"") -> subprocess.Popen:
+    """
+    A running process that prints stdout (and err to stderr) and exits with
+    returncode, like run_kubectl_stream().
+    """
+    script = (
+        "import sys; sys.stderr.buffer.write(%r); sys.stdout.buffer.write(sys.stdin.buffer.read()); sys.exit(%d)"
+        % (err, returncode)
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr
+    )
+    proc.stdin.write(stdout)
+    proc.stdin.close()
+    return proc
+
+
+@pytest.fixture
+def streamed():
+    """Factory for fake run_kubectl_stream() processes: streamed(stdout, returncode=0, ...)."""
+    return _streamed
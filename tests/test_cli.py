@@ -1,8 +1,13 @@
 """Tests for term-dx CLI."""
 
+import contextlib
+import json
+import subprocess
+
 import pytest
 from click.testing import CliRunner
 
+from term_dx import cli, kubectl
 from term_dx.cli import main
 
 
@@ -13,3 +18,85 @@ def test_cli_help():
     assert result.exit_code == 0
     assert "term-dx" in result.output
     assert "terminating" in result.output.lower()
+
+
+def test_cli_asks_kubectl_for_terminating_items_only(monkeypatch, streamed):
+    """Scans request a kubectl-side deletionTimestamp filter and diagnose what it returns."""
+    calls = []
+    stuck = {
+        "metadata": {
+            "name": "web-1",
+            "namespace": "app",
+            "deletionTimestamp": "2024-01-01T00:00:00Z",
+            "finalizers": ["example.com/block"],
+        }
+    }
+
+    def fake_stream(args, stderr=None):
+        calls.append(args)
+        # A live item slipped through is still dropped client-side
+        body = json.dumps([stuck, {"metadata": {"name": "live", "namespace": "app"}}]).encode()
+        return streamed(body, stderr=stderr)
+
+    def fake_run(args, capture=True, text=True):
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout=json.dumps(stuck), stderr="")
+
+    monkeypatch.setattr(kubectl, "run_kubectl_stream", fake_stream)
+    monkeypatch.setattr(kubectl, "run_kubectl", fake_run)
+    result = CliRunner().invoke(main, ["pod", "-n", "app"])
+    assert result.exit_code == 0
+    assert calls[0] == [
+        "get",
+        "pods",
+        "-o",
+        "jsonpath-as-json={.items[?(@.metadata.deletionTimestamp)]}",
+        "-n",
+        "app",
+    ]
+    assert "pods/web-1" in result.output
+    assert "live" not in result.output
+    assert "example.com/block" in result.output
+
+
+def test_cli_namespace_skips_cluster_scoped_kinds(monkeypatch, streamed):
+    """With -n, namespaces/CRDs are only scanned when requested explicitly."""
+    scanned = []
+
+    def fake_stream(args, stderr=None):
+        scanned.append(args[1])
+        return streamed(b"[]", stderr=stderr)
+
+    monkeypatch.setattr(kubectl, "run_kubectl_stream", fake_stream)
+    assert CliRunner().invoke(main, ["-n", "app"]).exit_code == 0
+    assert "namespaces" not in scanned
+    assert "customresourcedefinitions" not in scanned
+    assert "pods" in scanned
+
+    scanned.clear()
+    assert CliRunner().invoke(main, ["namespace", "-n", "app"]).exit_code == 0
+    assert scanned == ["namespaces"]
+
+
+@pytest.mark.parametrize(
+    "args, started",
+    [
+        ([], False),
+        (["--proxy"], True),
+        (["--proxy", "-l"], False),
+        (["--proxy", "pod", "web-1", "-n", "app"], False),
+    ],
+)
+def test_cli_proxy_is_opt_in(monkeypatch, args, started):
+    """kubectl proxy only starts with --proxy, and not for listing or a single named resource."""
+    calls = []
+
+    @contextlib.contextmanager
+    def fake_proxy():
+        calls.append(True)
+        yield None
+
+    monkeypatch.setattr(cli, "kubectl_proxy", fake_proxy)
+    monkeypatch.setattr(cli, "run_diagnosis", lambda *a, **k: None)
+    monkeypatch.setattr(cli, "list_terminating", lambda *a, **k: None)
+    assert CliRunner().invoke(main, args).exit_code == 0
+    assert bool(calls) == started
@@ -0,0 +1,105 @@
+"""Tests for term-dx diagnosis helpers."""
+
+import subprocess
+import time
+
+import pytest
+
+from term_dx import diagnose
+
+
+def test_fetch_all_preserves_order(monkeypatch):
+    """_fetch_all yields results in input order even when calls finish out of order."""
+    delays = {"namespaces": 0.05, "pods": 0.0, "secrets": 0.02}
+
+    def fake_stream(kind, name=None, namespace=None):
+        time.sleep(delays[kind])
+        yield {"kind": kind, "namespace": namespace}
+
+    monkeypatch.setattr(diagnose, "kubectl_stream_terminating", fake_stream)
+    results = list(diagnose._fetch_all(["namespaces", "pods", "secrets"], "app", None))
+    assert [kind for kind, _ in results] == ["namespaces", "pods", "secrets"]
+
+
+def test_diagnose_namespace_lists_remaining_with_one_get(monkeypatch, capsys):
+    """Remaining resources come from one combined kubectl get across all types."""
+    calls = []
+
+    def fake_run(args, capture=True, text=True):
+        calls.append(args)
+        if args[:2] == ["get", "pods,ingresses.networking.k8s.io"]:
+            out = "pod/web-1\ningress.networking.k8s.io/web\n"
+        else:
+            out = ""
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout=out, stderr="")
+
+    monkeypatch.setattr(diagnose, "run_kubectl", fake_run)
+    monkeypatch.setattr(diagnose, "cached_api_resources", lambda: ["pods", "ingresses.networking.k8s.io"])
+    monkeypatch.setattr(
+        diagnose,
+        "kubectl_get_json",
+        lambda kind, name=None, namespace=None, all_ns=False: {
+            "metadata": {"name": name, "deletionTimestamp": "2024-01-01T00:00:00Z"}
+        },
+    )
+    monkeypatch.setattr(
+        diagnose,
+        "kubectl_get_many_finalizers",
+        lambda resource_type, names, namespace: {
+            n: ["example.com/block"] if resource_type == "ingress.networking.k8s.io" else [] for n in names
+        },
+    )
+    diagnose.diagnose_namespace("stuck", verbose=False)
+    out = capsys.readouterr().out
+    assert sum(1 for a in calls if a[0] == "get") == 1
+    assert "kubectl delete pod/web-1 -n stuck" in out
+    assert "kubectl patch ingress.networking.k8s.io/web -n stuck" in out
+    assert "example.com/block" in out
+
+
+def test_list_terminating_named_resource_single_lookup(monkeypatch, capsys):
+    """A named single-kind listing does one lookup without the scan thread pool."""
+    calls = []
+
+    def fake_names(kind, name=None, namespace=None):
+        calls.append((kind, name, namespace))
+        return [("app", name, "2024-01-01T00:00:00Z")]
+
+    monkeypatch.setattr(diagnose, "kubectl_get_terminating_names", fake_names)
+    monkeypatch.setattr(diagnose, "ThreadPoolExecutor", lambda *a, **k: pytest.fail("scan pool used"))
+    diagnose.list_terminating(["pods"], "app", "web-1", user_specified_kind=True)
+    assert calls == [("pods", "web-1", "app")]
+    assert "pods/web-1 (ns: app)" in capsys.readouterr().out
+
+
+def test_diagnose_namespace_fallback_uses_same_type_labels(monkeypatch, capsys):
+    """The per-type fallback labels rows with the same "-o name" prefix as the combined get."""
+
+    def fake_run(args, capture=True, text=True):
+        if args[:2] == ["get", "pods,ingresses.networking.k8s.io"]:
+            return subprocess.CompletedProcess(args=args, returncode=1, stdout="", stderr="forbidden")
+        out = {"pods": "pod/web-1\n", "ingresses.networking.k8s.io": "ingress.networking.k8s.io/web\n"}.get(args[1], "")
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout=out, stderr="")
+
+    monkeypatch.setattr(diagnose, "run_kubectl", fake_run)
+    monkeypatch.setattr(diagnose, "cached_api_resources", lambda: ["pods", "ingresses.networking.k8s.io"])
+    monkeypatch.setattr(
+        diagnose,
+        "kubectl_get_json",
+        lambda kind, name=None, namespace=None, all_ns=False: {"metadata": {"name": name}},
+    )
+    monkeypatch.setattr(diagnose, "_fetch_finalizers", lambda resource_type, names, namespace: [])
+    diagnose.diagnose_namespace("stuck", verbose=False)
+    out = capsys.readouterr().out
+    assert "    pod " in out
+    assert "    ingress.networking.k8s.io " in out
+    assert "    pods " not in out
+
+
+def test_diagnose_namespaced_resource_renders_patch_command(monkeypatch, capsys):
+    """The finalizer remediation is a copy-pasteable merge patch that clears finalizers."""
+    stuck = {"metadata": {"name": "web-1", "deletionTimestamp": "T", "finalizers": ["example.com/block"]}}
+    monkeypatch.setattr(diagnose, "kubectl_get_json", lambda *a, **k: stuck)
+    diagnose.diagnose_namespaced_resource("pods", "web-1", "app", False)
+    out = capsys.readouterr().out
+    assert "kubectl patch pods web-1 -n app -p '{\"metadata\":{\"finalizers\":null}}' --type=merge" in out
@@ -0,0 +1,337 @@
+"""Tests for term-dx kubectl helpers."""
+
+import http.server
+import json
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from term_dx import kubectl
+
+
+def _completed(stdout: str, returncode: int = 0) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr="")
+
+
+def test_kubectl_get_many_finalizers_batches_with_jsonpath(monkeypatch):
+    """Several names are fetched in one jsonpath call; a single name uses the object form."""
+    calls = []
+    responses = [
+        _completed("a\texample.com/one,example.com/two,\nb\t\n"),
+        _completed("a\texample.com/one,\n"),
+        _completed(""),
+    ]
+
+    def fake_run(args, capture=True, text=True):
+        calls.append(args)
+        return responses.pop(0)
+
+    monkeypatch.setattr(kubectl, "run_kubectl", fake_run)
+    assert kubectl.kubectl_get_many_finalizers("pod", ["a", "b"], "app") == {
+        "a": ["example.com/one", "example.com/two"],
+        "b": [],
+    }
+    assert calls[0][:4] == ["get", "pod", "a", "b"]
+    assert calls[0][-1].startswith("jsonpath={range .items[*]}")
+    assert kubectl.kubectl_get_many_finalizers("pod", ["a"], "app") == {"a": ["example.com/one"]}
+    assert calls[1][:3] == ["get", "pod", "a"]
+    assert calls[1][-1].startswith("jsonpath={.metadata.name}")
+    # Deleted since listing: --ignore-not-found prints nothing, so it is omitted
+    assert kubectl.kubectl_get_many_finalizers("pod", ["gone"], "app") == {}
+    assert all("--ignore-not-found" in args for args in calls)
+
+
+def test_kubectl_get_many_finalizers_failure_returns_none(monkeypatch):
+    """kubectl_get_many_finalizers returns None on kubectl error so callers can fall back."""
+    monkeypatch.setattr(kubectl, "run_kubectl", lambda args, capture=True, text=True: _completed("", 1))
+    assert kubectl.kubectl_get_many_finalizers("pod", ["a", "b"], "app") is None
+
+
+def test_cached_api_resources_reuses_disk_cache(monkeypatch, tmp_path):
+    """A second call within the TTL reads the cache instead of running api-resources."""
+    calls = []
+
+    def fake_run(args, capture=True, text=True):
+        calls.append(args[0])
+        if args[:2] == ["config", "current-context"]:
+            return _completed("staging\n")
+        return _completed("pods\nsecrets\n")
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(kubectl, "run_kubectl", fake_run)
+    assert kubectl.cached_api_resources() == ["pods", "secrets"]
+    assert kubectl.cached_api_resources() == ["pods", "secrets"]
+    assert calls.count("api-resources") == 1
+    assert len(list((tmp_path / "term-dx").glob("api-resources-*.txt"))) == 1
+
+
+def test_kubectl_get_json_memoized(monkeypatch):
+    """Repeated kubectl_get_json calls reuse one kubectl run and return independent copies."""
+    calls = []
+
+    def fake_run(args, capture=True, text=True):
+        calls.append(args)
+        return _completed(json.dumps({"metadata": {"name": "ns1"}}))
+
+    monkeypatch.setattr(kubectl, "run_kubectl", fake_run)
+    kubectl.clear_cache()
+    first = kubectl.kubectl_get_json("namespaces", name="ns1")
+    first["metadata"]["name"] = "mutated"
+    second = kubectl.kubectl_get_json("namespaces", name="ns1")
+    assert second["metadata"]["name"] == "ns1"
+    assert len(calls) == 1
+    kubectl.clear_cache()
+    kubectl.kubectl_get_json("namespaces", name="ns1")
+    assert len(calls) == 2
+    kubectl.clear_cache()
+
+
+def test_kubectl_stream_terminating_falls_back_to_streamed_list(monkeypatch, streamed):
+    """When kubectl's jsonpath filter fails, the full list is streamed and filtered."""
+    body = json.dumps(
+        {
+            "items": [
+                {"metadata": {"name": "live"}},
+                {"metadata": {"name": "stuck", "deletionTimestamp": "2024-01-01T00:00:00Z"}},
+            ]
+        }
+    ).encode()
+
+    seen = []
+
+    def fake_stream(args, stderr=None):
+        seen.append(args[3])
+        if args[3].startswith("jsonpath-as-json="):
+            err = b'error: unable to match a printer suitable for the output format "jsonpath-as-json"'
+            return streamed(b"", 1, stderr=stderr, err=err)
+        return streamed(body, stderr=stderr)
+
+    monkeypatch.setattr(kubectl, "run_kubectl_stream", fake_stream)
+    items = list(kubectl.kubectl_stream_terminating("pods"))
+    assert [i["metadata"]["name"] for i in items] == ["stuck"]
+    assert seen == ["jsonpath-as-json={.items[?(@.metadata.deletionTimestamp)]}", "json"]
+
+
+def test_kubectl_stream_terminating_streams_filtered_array(monkeypatch, streamed):
+    """kubectl's jsonpath-as-json array is parsed directly, with no full-list fallback."""
+    body = json.dumps(
+        [{"metadata": {"name": "stuck", "deletionTimestamp": "2024-01-01T00:00:00Z"}}]
+    ).encode()
+    seen = []
+
+    def fake_stream(args, stderr=None):
+        seen.append(args)
+        return streamed(body, stderr=stderr)
+
+    monkeypatch.setattr(kubectl, "run_kubectl_stream", fake_stream)
+    assert [i["metadata"]["name"] for i in kubectl.kubectl_stream_terminating("pods", namespace="app")] == ["stuck"]
+    assert len(seen) == 1
+
+
+@pytest.mark.parametrize("body", [b'[{"metadata": {"name": "stuck", "deletionTimestamp": "T"}}]', b""])
+def test_kubectl_stream_terminating_failed_run_yields_nothing(monkeypatch, streamed, body):
+    """A failed filtered run (partial output or e.g. forbidden) is neither kept nor retried as a full list."""
+    seen = []
+
+    def fake_stream(args, stderr=None):
+        seen.append(args)
+        return streamed(body, 1, stderr=stderr, err=b'Error from server (Forbidden): pods is forbidden')
+
+    monkeypatch.setattr(kubectl, "run_kubectl_stream", fake_stream)
+    assert list(kubectl.kubectl_stream_terminating("pods", namespace="app")) == []
+    assert len(seen) == 1
+
+
+def test_run_kubectl_stream_sets_request_timeout(monkeypatch):
+    """Streamed scans keep a deadline: kubectl is told to give up on a stalled request."""
+    seen = []
+    monkeypatch.setattr(kubectl.subprocess, "Popen", lambda cmd, **kwargs: seen.append(cmd))
+    kubectl.run_kubectl_stream(["get", "pods", "-A", "-o", "json"])
+    assert seen[0][1:] == ["get", "pods", "-A", "-o", "json", "--request-timeout=60s"]
+
+
+def test_kubectl_get_terminating_names_parses_jsonpath(monkeypatch):
+    """Jsonpath lines become (namespace, name, deletionTimestamp) tuples."""
+    seen = []
+
+    def fake_run(args, capture=True, text=True):
+        seen.append(args)
+        return _completed("app|web-1|2024-01-01T00:00:00Z\n|stuck-ns|2024-01-02T00:00:00Z\n")
+
+    monkeypatch.setattr(kubectl, "run_kubectl", fake_run)
+    assert kubectl.kubectl_get_terminating_names("pods") == [
+        ("app", "web-1", "2024-01-01T00:00:00Z"),
+        ("", "stuck-ns", "2024-01-02T00:00:00Z"),
+    ]
+    assert seen[0][3].startswith("jsonpath={range .items[?(@.metadata.deletionTimestamp)]}")
+
+
+def test_kubectl_get_terminating_names_skips_live_named_resource(monkeypatch):
+    """A named resource without a deletion timestamp is not reported."""
+    monkeypatch.setattr(kubectl, "run_kubectl", lambda args, capture=True, text=True: _completed("app|web-1|"))
+    assert kubectl.kubectl_get_terminating_names("pods", name="web-1", namespace="app") == []
+
+
+def test_kubectl_get_json_prefers_client(monkeypatch):
+    """Built-in kinds are served by the kubernetes client when available, without kubectl."""
+    monkeypatch.setattr(
+        kubectl,
+        "_api_get",
+        lambda kind, name, namespace: {"metadata": {"name": name}} if kind == "pods" else None,
+    )
+    monkeypatch.setattr(kubectl, "run_kubectl", lambda args, capture=True, text=True: pytest.fail("kubectl called"))
+    kubectl.clear_cache()
+    assert kubectl.kubectl_get_json("pods", name="web-1", namespace="app") == {"metadata": {"name": "web-1"}}
+    kubectl.clear_cache()
+
+
+def test_wait_for_proxy_parses_address():
+    """The proxy address is read from kubectl proxy's startup line."""
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "print('Starting to serve on 127.0.0.1:40123', flush=True)"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert kubectl._wait_for_proxy(proc) == "127.0.0.1:40123"
+    proc.wait()
+
+
+def test_proxy_get_builds_rest_paths(monkeypatch):
+    """Named GETs go to quoted REST paths; lists never go to the proxy; only NotFound means missing."""
+    paths = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            paths.append(self.path)
+            status, body = 200, json.dumps({"metadata": {"name": "x"}}).encode()
+            if self.path.endswith("/missing"):
+                status_obj = {"kind": "Status", "reason": "NotFound", "details": {"name": "missing"}}
+                status, body = 404, json.dumps(status_obj).encode()
+            elif self.path.endswith("/unserved"):
+                status, body = 404, b"404 page not found"
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        monkeypatch.setattr(kubectl, "_proxy_addr", f"127.0.0.1:{server.server_address[1]}")
+        assert kubectl._proxy_get("pods", None, None) is None
+        assert kubectl._proxy_get("pods", None, "app") is None
+        assert kubectl._proxy_get("pods", "web-1", None) is None
+        assert kubectl._proxy_get("pods", "web-1", "app") == {"metadata": {"name": "x"}}
+        assert kubectl._proxy_get("crd", "widgets.example.com", None) == {"metadata": {"name": "x"}}
+        assert kubectl._proxy_get("namespace", "missing", None) == {}
+        assert kubectl._proxy_get("pods", "unserved", "app") is None
+        assert kubectl._proxy_get("secrets", "a/../b?c", "app") == {"metadata": {"name": "x"}}
+        assert kubectl._proxy_get("ingresses", "web", "app") is None
+    finally:
+        server.shutdown()
+    assert paths == [
+        "/api/v1/namespaces/app/pods/web-1",
+        "/apis/apiextensions.k8s.io/v1/customresourcedefinitions/widgets.example.com",
+        "/api/v1/namespaces/missing",
+        "/api/v1/namespaces/app/pods/unserved",
+        "/api/v1/namespaces/app/secrets/a%2F..%2Fb%3Fc",
+    ]
+
+
+def test_items_with_deletion_list_and_single():
+    """List and single-object responses are filtered on metadata.deletionTimestamp."""
+    stuck = {"metadata": {"name": "a", "deletionTimestamp": "2024-01-01T00:00:00Z"}}
+    live = {"metadata": {"name": "b"}}
+    assert kubectl.items_with_deletion({"items": [stuck, live, {}]}) == [stuck]
+    assert kubectl.items_with_deletion(stuck) == [stuck]
+    assert kubectl.items_with_deletion(live) == []
+    assert list(kubectl.iter_items_with_deletion({"items": [live, stuck]})) == [stuck]
+    assert list(kubectl.iter_items_with_deletion(live)) == []
+
+
+def test_kubectl_get_finalizers_jsonpath(monkeypatch):
+    """Finalizers come back one per line; a gone resource has none; errors return None."""
+    seen = []
+
+    def fake_run(args, capture=True, text=True):
+        seen.append(args)
+        return _completed("group.ingress.k8s.aws/alb\nexample.com/block\n")
+
+    monkeypatch.setattr(kubectl, "run_kubectl", fake_run)
+    assert kubectl.kubectl_get_finalizers("ingress.networking.k8s.io/web", "app") == [
+        "group.ingress.k8s.aws/alb",
+        "example.com/block",
+    ]
+    assert seen[0][:3] == ["get", "ingress.networking.k8s.io", "web"]
+    assert "--ignore-not-found" in seen[0]
+
+    monkeypatch.setattr(kubectl, "run_kubectl", lambda args, capture=True, text=True: _completed(""))
+    assert kubectl.kubectl_get_finalizers("pod/gone", "app") == []
+
+    monkeypatch.setattr(kubectl, "run_kubectl", lambda args, capture=True, text=True: _completed("", 1))
+    assert kubectl.kubectl_get_finalizers("pod/web-1", "app") is None
+
+
+def test_kubectl_get_json_alias_shares_cache_and_failures_retry(monkeypatch):
+    """Aliases and cluster-scoped namespace filters share a cache entry; failures are not cached."""
+    calls = []
+    responses = [_completed("", 1), _completed(json.dumps({"metadata": {"name": "ns1"}}))]
+
+    def fake_run(args, capture=True, text=True):
+        calls.append(args)
+        return responses.pop(0)
+
+    monkeypatch.setattr(kubectl, "run_kubectl", fake_run)
+    kubectl.clear_cache()
+    assert kubectl.kubectl_get_json("namespaces", name="ns1") is None
+    assert kubectl.kubectl_get_json("namespaces", name="ns1") == {"metadata": {"name": "ns1"}}
+    assert kubectl.kubectl_get_json("namespace", name="ns1") == {"metadata": {"name": "ns1"}}
+    # A namespace filter does not apply to cluster-scoped kinds
+    assert kubectl.kubectl_get_json("namespaces", name="ns1", namespace="app") == {"metadata": {"name": "ns1"}}
+    assert len(calls) == 2
+    assert calls[1] == ["get", "namespaces", "-o", "json", "ns1"]
+    kubectl.clear_cache()
+
+
+def test_client_get_serves_named_reads_only(monkeypatch):
+    """List requests never go through the kubernetes client."""
+    monkeypatch.setattr(kubectl, "_api", lambda api_class: pytest.fail("client used for a list"))
+    assert kubectl._client_get("pods", None, None) is None
+    assert kubectl._client_get("secrets", None, "app") is None
+
+
+def test_client_get_reads_named_resources(monkeypatch):
+    """Named reads parse the raw response; 404 means missing, other API errors fall back."""
+
+    class FakeApiException(Exception):
+        def __init__(self, status):
+            super().__init__(status)
+            self.status = status
+
+    class FakeResponse:
+        data = b'{"metadata": {"name": "web-1", "namespace": "app"}}'
+
+    class FakeCoreV1Api:
+        def read_namespaced_pod(self, name, namespace, _preload_content=True):
+            assert _preload_content is False
+            if name == "gone":
+                raise FakeApiException(404)
+            if name == "denied":
+                raise FakeApiException(403)
+            return FakeResponse()
+
+    monkeypatch.setattr(kubectl, "k8s_client", type("client", (), {"ApiException": FakeApiException}))
+    monkeypatch.setattr(kubectl, "_api", lambda api_class: FakeCoreV1Api())
+    assert kubectl._client_get("pod", "web-1", "app") == {"metadata": {"name": "web-1", "namespace": "app"}}
+    assert kubectl._client_get("pods", "gone", "app") == {}
+    assert kubectl._client_get("pods", "denied", "app") is None
+    # Namespaced kinds need a namespace; unsupported kinds stay on kubectl
+    assert kubectl._client_get("pods", "web-1", None) is None
+    assert kubectl._client_get("deployments", "web", "app") is None